@@ -17,6 +17,10 @@ from pydantic import validator
 from zenml.artifact_stores import BaseArtifactStore
 from zenml.constants import REMOTE_FS_PREFIX
 
+# `str.startswith` accepts a tuple of prefixes and checks them in C, so
+# build the tuple once at import time instead of on every validation.
+_REMOTE_FS_PREFIX_TUPLE = tuple(REMOTE_FS_PREFIX)
+
 
 class LocalArtifactStore(BaseArtifactStore):
     """Artifact Store for local artifacts."""
@@ -24,6 +28,6 @@ class LocalArtifactStore(BaseArtifactStore):
     @validator("path")
     def must_be_local_path(cls, v: str) -> str:
         """Validates that the path is a local path."""
-        if any([v.startswith(prefix) for prefix in REMOTE_FS_PREFIX]):
+        if v.startswith(_REMOTE_FS_PREFIX_TUPLE):
             raise ValueError("Must be a local path.")
         return v
@@ -373,14 +373,45 @@ To see which stack is currently set as the default active stack, type:
 
 """
 
-from zenml.cli.artifact_store import *  # noqa
-from zenml.cli.base import *  # noqa
-from zenml.cli.config import *  # noqa
-from zenml.cli.container_registry import *  # noqa
-from zenml.cli.example import *  # noqa
-from zenml.cli.integration import *  # noqa
-from zenml.cli.metadata_store import *  # noqa
-from zenml.cli.orchestrator import *  # noqa
-from zenml.cli.pipeline import *  # noqa
-from zenml.cli.stack import *  # noqa
-from zenml.cli.version import *  # noqa
+from typing import Any
+
+from zenml.cli.cli import cli  # noqa
+
+# The subcommand modules used to be star-imported here, which meant that
+# importing `zenml.cli` (and therefore every CLI invocation) imported all
+# command modules and their dependencies up front. The root `cli` group now
+# imports command modules lazily, and attribute access on this package is
+# resolved on demand so existing `from zenml.cli import ...` imports keep
+# working.
+_CLI_MODULES = [
+    "zenml.cli.artifact_store",
+    "zenml.cli.base",
+    "zenml.cli.config",
+    "zenml.cli.container_registry",
+    "zenml.cli.example",
+    "zenml.cli.integration",
+    "zenml.cli.metadata_store",
+    "zenml.cli.orchestrator",
+    "zenml.cli.pipeline",
+    "zenml.cli.stack",
+    "zenml.cli.version",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves attributes from the CLI submodules on first access."""
+    import importlib
+
+    # Resolve submodule names (e.g. `from zenml.cli import utils`) directly,
+    # before scanning the command modules below: the command modules
+    # themselves import `zenml.cli.utils` through this hook, so scanning
+    # them while a submodule is mid-initialization would end in a circular
+    # import.
+    if f"zenml.cli.{name}" in _CLI_MODULES or name in ("cli", "utils"):
+        return importlib.import_module(f"zenml.cli.{name}")
+
+    for module_name in _CLI_MODULES:
+        module = importlib.import_module(module_name)
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,13 +19,75 @@
 .. moduleauthor:: ZenML GmbH <support@zenml.io>
 """
 
+import importlib
+from typing import Any, Dict, List, Optional
+
 import click
 
 from zenml import __version__
 from zenml.logger import set_root_verbosity
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use.
+
+    Subcommand modules attach their commands to the root group when they
+    are imported, so deferring the import until a subcommand is actually
+    requested keeps `zenml --version` and single-command invocations from
+    paying the import cost of every other command module.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initializes the lazy group.
+
+        Args:
+            *args: Positional args passed to `click.Group`.
+            lazy_subcommands: Maps subcommand names to the dotted path of
+                the module that registers them.
+            **kwargs: Keyword args passed to `click.Group`.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Lists all commands, including ones not imported yet."""
+        return sorted(
+            set(super().list_commands(ctx)) | set(self.lazy_subcommands)
+        )
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """Gets a command, importing its defining module if necessary."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            # Importing the module registers its commands on this group.
+            importlib.import_module(self.lazy_subcommands[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "analytics": "zenml.cli.config",
+        "artifact-store": "zenml.cli.artifact_store",
+        "clean": "zenml.cli.base",
+        "container-registry": "zenml.cli.container_registry",
+        "example": "zenml.cli.example",
+        "init": "zenml.cli.base",
+        "integration": "zenml.cli.integration",
+        "logging": "zenml.cli.config",
+        "metadata-store": "zenml.cli.metadata_store",
+        "orchestrator": "zenml.cli.orchestrator",
+        "pipeline": "zenml.cli.pipeline",
+        "stack": "zenml.cli.stack",
+        "version": "zenml.cli.version",
+    },
+)
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
     """ZenML"""
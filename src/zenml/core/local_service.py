@@ -223,7 +223,10 @@ class LocalService(BaseComponent):
         # Add the mapping.
         artifact_store.update()
         source = source_utils.resolve_class(artifact_store.__class__)
-        self.artifact_store_map[key] = UUIDSourceTuple(
+        # The uuid comes from the component itself and the source from
+        # `resolve_class`, so the data is trusted and we can skip pydantic
+        # validation here.
+        self.artifact_store_map[key] = UUIDSourceTuple.construct(
             uuid=artifact_store.uuid, source=source
         )
         self.update()
@@ -292,7 +295,10 @@ class LocalService(BaseComponent):
         # Add the mapping.
         metadata_store.update()
         source = source_utils.resolve_class(metadata_store.__class__)
-        self.metadata_store_map[key] = UUIDSourceTuple(
+        # The uuid comes from the component itself and the source from
+        # `resolve_class`, so the data is trusted and we can skip pydantic
+        # validation here.
+        self.metadata_store_map[key] = UUIDSourceTuple.construct(
             uuid=metadata_store.uuid, source=source
         )
         self.update()
@@ -361,7 +367,10 @@ class LocalService(BaseComponent):
         # Add the mapping.
         orchestrator.update()
         source = source_utils.resolve_class(orchestrator.__class__)
-        self.orchestrator_map[key] = UUIDSourceTuple(
+        # The uuid comes from the component itself and the source from
+        # `resolve_class`, so the data is trusted and we can skip pydantic
+        # validation here.
+        self.orchestrator_map[key] = UUIDSourceTuple.construct(
             uuid=orchestrator.uuid, source=source
         )
         self.update()
@@ -431,7 +440,10 @@ class LocalService(BaseComponent):
         # Add the mapping.
         container_registry.update()
         source = source_utils.resolve_class(container_registry.__class__)
-        self.container_registry_map[key] = UUIDSourceTuple(
+        # The uuid comes from the component itself and the source from
+        # `resolve_class`, so the data is trusted and we can skip pydantic
+        # validation here.
+        self.container_registry_map[key] = UUIDSourceTuple.construct(
             uuid=container_registry.uuid, source=source
         )
         self.update()
@@ -76,9 +76,11 @@ def get_components_from_store(
         zenml.io.utils.get_zenml_config_dir(repo_path),
         store_name,
     )
+    # Invert the mapping once instead of once per serialized component file.
+    inverted_map = {v.uuid: k for k, v in mapping.items()}
     comps = {}
     for fnames in fileio.list_dir(store_dir, only_file_names=True):
         uuid = Path(fnames).stem
-        key = get_key_from_uuid(UUID(uuid), mapping)
+        key = inverted_map[UUID(uuid)]
         comps[key] = get_component_from_key(key, mapping, repo_path)
     return comps
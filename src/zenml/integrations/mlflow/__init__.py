@@ -24,6 +24,3 @@ class MlflowIntegration(Integration):
 
     NAME = MLFLOW
     REQUIREMENTS = ["mlflow>=1.2.0"]
-
-
-MlflowIntegration.check_installation()
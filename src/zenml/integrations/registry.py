@@ -12,7 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
 
 from zenml.exceptions import IntegrationError
 from zenml.logger import get_logger
@@ -29,6 +30,7 @@ class IntegrationRegistry(object):
     def __init__(self) -> None:
         """Initializing the integration registry"""
         self._integrations: Dict[str, Type["Integration"]] = {}
+        self._activated_integrations: Set[str] = set()
 
     @property
     def integrations(self) -> Dict[str, Type["Integration"]]:
@@ -59,8 +61,14 @@ class IntegrationRegistry(object):
         """Method to activate the integrations with are registered in the
         registry"""
         for name, integration in self._integrations.items():
+            if name in self._activated_integrations:
+                # The installation check scans the installed distributions,
+                # so skip integrations that were already activated earlier
+                # in this process.
+                continue
             if integration.check_installation():
                 integration.activate()
+                self._activated_integrations.add(name)
                 logger.debug(f"Integration `{name}` is activated.")
             else:
                 logger.debug(f"Integration `{name}` could not be activated.")
@@ -85,22 +93,24 @@ class IntegrationRegistry(object):
                     f"{self.list_integration_names}"
                 )
         else:
-            return [
-                requirement
-                for name in self.list_integration_names
-                for requirement in self._integrations[name].REQUIREMENTS
-            ]
+            return list(
+                chain.from_iterable(
+                    integration.REQUIREMENTS
+                    for integration in self._integrations.values()
+                )
+            )
 
     def is_installed(self, integration_name: Optional[str] = None) -> bool:
         """Checks if all requirements for an integration are installed"""
         if integration_name in self.list_integration_names:
             return self._integrations[integration_name].check_installation()
         elif not integration_name:
-            all_installed = [
-                self._integrations[item].check_installation()
-                for item in self.list_integration_names
-            ]
-            return any(all_installed)
+            # Stop at the first installed integration instead of running the
+            # installation check for every single one.
+            return any(
+                integration.check_installation()
+                for integration in self._integrations.values()
+            )
         else:
             raise KeyError(
                 f"Integration '{integration_name}' not found. "
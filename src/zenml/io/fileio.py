@@ -25,6 +25,11 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# `str.startswith` matches a tuple of prefixes in a single C-level pass over
+# the path, so build the tuple once at import time. Should the prefix list
+# ever grow much larger, a prefix trie would be the next step up.
+_REMOTE_FS_PREFIX_TUPLE = tuple(REMOTE_FS_PREFIX)
+
 
 def _get_filesystem(path: PathType) -> Type[Filesystem]:
     """Returns a filesystem class for a given path from the registry"""
@@ -188,13 +193,16 @@ def find_files(dir_path: PathType, pattern: str) -> Iterable[str]:
     Yields:
          All matching filenames if found, else None.
     """
+    # Bind the per-file calls to locals; this loop runs once per file in
+    # the walked tree and the method lookups add up on large directories.
+    match = fnmatch.fnmatch
+    join = os.path.join
     for root, dirs, files in walk(dir_path):
+        root_str = convert_to_str(root)
         for basename in files:
-            if fnmatch.fnmatch(convert_to_str(basename), pattern):
-                filename = os.path.join(
-                    convert_to_str(root), convert_to_str(basename)
-                )
-                yield filename
+            basename_str = convert_to_str(basename)
+            if match(basename_str, pattern):
+                yield join(root_str, basename_str)
 
 
 def is_remote(path: str) -> bool:
@@ -206,7 +214,7 @@ def is_remote(path: str) -> bool:
     Returns:
         True if remote path, else False.
     """
-    return any(path.startswith(prefix) for prefix in REMOTE_FS_PREFIX)
+    return path.startswith(_REMOTE_FS_PREFIX_TUPLE)
 
 
 def create_file_if_not_exists(
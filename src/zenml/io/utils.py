@@ -1,3 +1,4 @@
+import functools
 import os
 import tarfile
 from pathlib import Path
@@ -148,8 +149,10 @@ def get_zenml_dir(path: Optional[str] = None) -> str:
     return str(Path(path).resolve())
 
 
+@functools.lru_cache(maxsize=1)
 def get_global_config_directory() -> str:
     """Returns the global config directory for ZenML."""
+    # The app dir never changes within a process, so resolve it only once.
     return click.get_app_dir(APP_NAME)
 
 
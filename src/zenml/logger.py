@@ -57,6 +57,16 @@ class CustomFormatter(logging.Formatter):
         LoggingLevels.CRITICAL: bold_red,
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # The verbosity is fixed at import time, so the colored format
+        # string and the inner formatter can be built once here instead of
+        # once per log record.
+        self._color = self.COLORS[LoggingLevels[ZENML_LOGGING_VERBOSITY]]
+        self._formatter = logging.Formatter(
+            self._color + self.format_template + self.reset
+        )
+
     def format(self, record: logging.LogRecord) -> str:
         """Converts a log record to a (colored) string
 
@@ -66,23 +76,12 @@ class CustomFormatter(logging.Formatter):
         Returns:
             A string formatted according to specifications.
         """
-        log_fmt = (
-            self.COLORS[LoggingLevels[ZENML_LOGGING_VERBOSITY]]
-            + self.format_template
-            + self.reset
-        )
-        formatter = logging.Formatter(log_fmt)
-        formatted_message = formatter.format(record)
+        formatted_message = self._formatter.format(record)
         quoted_groups = re.findall("`([^`]*)`", formatted_message)
         for quoted in quoted_groups:
             formatted_message = formatted_message.replace(
                 "`" + quoted + "`",
-                "`"
-                + self.reset
-                + self.yellow
-                + quoted
-                + "`"
-                + self.COLORS.get(LoggingLevels[ZENML_LOGGING_VERBOSITY]),
+                "`" + self.reset + self.yellow + quoted + "`" + self._color,
             )
         return formatted_message
 
@@ -12,9 +12,10 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import inspect
-import time
+import logging
 from abc import abstractmethod
 from datetime import datetime
+from time import perf_counter
 from typing import (
     Any,
     ClassVar,
@@ -109,7 +110,7 @@ class BasePipeline(metaclass=BasePipelineMeta):
                 "stack active via `zenml stack set STACK_NAME`"
             ) from exc
 
-        kwargs.update(getattr(self, INSTANCE_CONFIGURATION))
+        kwargs.update(self.INSTANCE_CONFIGURATION)
         self.enable_cache = kwargs.pop(PARAM_ENABLE_CACHE, True)
         self.requirements_file = kwargs.pop(PARAM_REQUIREMENTS_FILE, None)
         self.dockerignore_file = kwargs.pop(PARAM_DOCKERIGNORE_FILE, None)
@@ -293,9 +294,11 @@ class BasePipeline(metaclass=BasePipelineMeta):
         integration_registry.activate_integrations()
 
         if not run_name:
+            # Avoid `strftime` with the locale-dependent `%h` token here:
+            # formatting via the f-string spec is cheaper and locale-free.
+            now = datetime.now()
             run_name = (
-                f"{self.name}-"
-                f'{datetime.now().strftime("%d_%h_%y-%H_%M_%S_%f")}'
+                f"{self.name}-{now:%Y%m%d-%H%M%S}-{now.microsecond:06d}"
             )
 
         analytics_utils.track_event(
@@ -306,7 +309,7 @@ class BasePipeline(metaclass=BasePipelineMeta):
             },
         )
 
-        start_time = time.time()
+        start_time = perf_counter()
         logger.info(
             "Using stack `%s` for pipeline `%s`. Running pipeline..",
             Repository().get_active_stack_key(),
@@ -318,17 +321,19 @@ class BasePipeline(metaclass=BasePipelineMeta):
             inspect.currentframe().f_back.f_code.co_filename  # type: ignore[union-attr] # noqa
         )
 
-        self.stack.orchestrator.pre_run(
-            pipeline=self, caller_filepath=caller_filepath
-        )
-        ret = self.stack.orchestrator.run(self, run_name=run_name)
-        self.stack.orchestrator.post_run()
-        run_duration = time.time() - start_time
-        logger.info(
-            "Pipeline run `%s` has finished in %s.",
-            run_name,
-            string_utils.get_human_readable_time(run_duration),
-        )
+        # Resolve the orchestrator once for all three run phases instead of
+        # dispatching through the stack properties per phase.
+        orchestrator = self.stack.orchestrator
+        orchestrator.pre_run(pipeline=self, caller_filepath=caller_filepath)
+        ret = orchestrator.run(self, run_name=run_name)
+        orchestrator.post_run()
+        run_duration = perf_counter() - start_time
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Pipeline run `%s` has finished in %s.",
+                run_name,
+                string_utils.get_human_readable_time(run_duration),
+            )
         return ret
 
     def with_config(
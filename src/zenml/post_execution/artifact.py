@@ -30,6 +30,18 @@ class ArtifactView:
     artifact data that was created during a pipeline execution.
     """
 
+    # Steps can produce many artifacts, so keep instances small by storing
+    # the fixed set of attributes in slots instead of a per-instance dict.
+    __slots__ = (
+        "_id",
+        "_type",
+        "_uri",
+        "_materializer",
+        "_data_type",
+        "_metadata_store",
+        "_parent_step_id",
+    )
+
     def __init__(
         self,
         id_: int,
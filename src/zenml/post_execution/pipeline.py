@@ -28,6 +28,10 @@ class PipelineView:
     pipeline-related information from the metadata store.
     """
 
+    # Keep instances small by storing the fixed set of attributes in slots
+    # instead of a per-instance dict, matching the step and artifact views.
+    __slots__ = ("_id", "_name", "_metadata_store")
+
     def __init__(
         self, id_: int, name: str, metadata_store: "BaseMetadataStore"
     ):
@@ -32,6 +32,10 @@ class PipelineRunView:
     steps and artifact information associated with a pipeline execution.
     """
 
+    # Keep instances small by storing the fixed set of attributes in slots
+    # instead of a per-instance dict, matching the step and artifact views.
+    __slots__ = ("_id", "_name", "_metadata_store", "_executions", "_steps")
+
     def __init__(
         self,
         id_: int,
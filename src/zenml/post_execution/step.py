@@ -26,6 +26,19 @@ class StepView:
     artifact information associated with a pipeline step.
     """
 
+    # Runs can contain many steps, so keep instances small by storing the
+    # fixed set of attributes in slots instead of a per-instance dict.
+    __slots__ = (
+        "_id",
+        "_parents_step_ids",
+        "_name",
+        "_pipeline_step_name",
+        "_parameters",
+        "_metadata_store",
+        "_inputs",
+        "_outputs",
+    )
+
     def __init__(
         self,
         id_: int,
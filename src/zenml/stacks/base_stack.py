@@ -54,6 +54,16 @@ class BaseStack(BaseSettings):
     container_registry_name: Optional[str] = None
     _repo_path: Optional[str] = PrivateAttr(default=None)
 
+    # Components are registered per repository and do not change for the
+    # lifetime of a stack object, so resolved components are memoized here
+    # to avoid re-loading them from the repository on every property access.
+    _orchestrator: Optional["BaseOrchestrator"] = PrivateAttr(default=None)
+    _artifact_store: Optional["BaseArtifactStore"] = PrivateAttr(default=None)
+    _metadata_store: Optional["BaseMetadataStore"] = PrivateAttr(default=None)
+    _container_registry: Optional["BaseContainerRegistry"] = PrivateAttr(
+        default=None
+    )
+
     def dict(self, **kwargs: Any) -> Dict[str, Any]:
         """Removes private attributes from pydantic dict so they don't get
         stored in our config files."""
@@ -66,39 +76,47 @@ class BaseStack(BaseSettings):
     @property
     def orchestrator(self) -> "BaseOrchestrator":
         """Returns the orchestrator of this stack."""
-        from zenml.core.repo import Repository
+        if self._orchestrator is None:
+            from zenml.core.repo import Repository
 
-        return Repository(self._repo_path).service.get_orchestrator(
-            self.orchestrator_name
-        )
+            self._orchestrator = Repository(
+                self._repo_path
+            ).service.get_orchestrator(self.orchestrator_name)
+        return self._orchestrator
 
     @property
     def artifact_store(self) -> "BaseArtifactStore":
         """Returns the artifact store of this stack."""
-        from zenml.core.repo import Repository
+        if self._artifact_store is None:
+            from zenml.core.repo import Repository
 
-        return Repository(self._repo_path).service.get_artifact_store(
-            self.artifact_store_name
-        )
+            self._artifact_store = Repository(
+                self._repo_path
+            ).service.get_artifact_store(self.artifact_store_name)
+        return self._artifact_store
 
     @property
     def metadata_store(self) -> "BaseMetadataStore":
         """Returns the metadata store of this stack."""
-        from zenml.core.repo import Repository
+        if self._metadata_store is None:
+            from zenml.core.repo import Repository
 
-        return Repository(self._repo_path).service.get_metadata_store(
-            self.metadata_store_name
-        )
+            self._metadata_store = Repository(
+                self._repo_path
+            ).service.get_metadata_store(self.metadata_store_name)
+        return self._metadata_store
 
     @property
     def container_registry(self) -> Optional["BaseContainerRegistry"]:
         """Returns the optional container registry of this stack."""
         if self.container_registry_name:
-            from zenml.core.repo import Repository
+            if self._container_registry is None:
+                from zenml.core.repo import Repository
 
-            return Repository(self._repo_path).service.get_container_registry(
-                self.container_registry_name
-            )
+                self._container_registry = Repository(
+                    self._repo_path
+                ).service.get_container_registry(self.container_registry_name)
+            return self._container_registry
         else:
             return None
 
@@ -46,7 +46,6 @@ from zenml.steps.base_step_config import BaseStepConfig
 from zenml.steps.step_context import StepContext
 from zenml.steps.step_output import Output
 from zenml.steps.utils import (
-    INSTANCE_CONFIGURATION,
     INTERNAL_EXECUTION_PARAMETER_PREFIX,
     PARAM_CREATED_BY_FUNCTIONAL_API,
     PARAM_ENABLE_CACHE,
@@ -216,7 +215,7 @@ class BaseStep(metaclass=BaseStepMeta):
         self.name = self.__class__.__name__
         self.pipeline_parameter_name: Optional[str] = None
 
-        kwargs.update(getattr(self, INSTANCE_CONFIGURATION))
+        kwargs.update(self.INSTANCE_CONFIGURATION)
 
         self.requires_context = bool(self.CONTEXT_PARAMETER_NAME)
         self._created_by_functional_api = kwargs.pop(
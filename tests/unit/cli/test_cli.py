@@ -13,10 +13,29 @@
 #  permissions and limitations under the License.
 
 from click.core import Group
+from click.testing import CliRunner
 
+from zenml import __version__ as current_zenml_version
 from zenml.cli import cli
 
 
 def test_cli_command_defines_a_cli_group() -> None:
     """Check that cli command defines a CLI group when invoked"""
     assert isinstance(cli, Group)
+
+
+def test_cli_help_lists_lazy_subcommands() -> None:
+    """Checks that lazily loaded subcommands show up in the help output"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    for subcommand in ["init", "stack", "version"]:
+        assert subcommand in result.output
+
+
+def test_cli_dispatches_lazy_subcommand() -> None:
+    """Checks that a lazily loaded subcommand can be invoked"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["version"])
+    assert result.exit_code == 0
+    assert current_zenml_version in result.output